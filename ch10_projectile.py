@@ -5,9 +5,11 @@ Provides a simple class for modeling the flight of projectiles.
 
 [Update 11/26/2023] The following changes have been made to Zelle's original class:
 - Added getVel() method that returns the current speed of the projectile.
+- The gravity terms of the integration step are computed once per time step used rather than on every update.
 """
    
-from math import sqrt, sin, cos, radians
+from math import hypot, sin, cos, radians
+
 
 class Projectile:
 
@@ -15,6 +17,8 @@ class Projectile:
     surface, ignoring wind resistance. Tracking is done in two
     dimensions, height (y) and distance (x)."""
 
+    __slots__ = ("xpos", "ypos", "xvel", "yvel", "vel", "_dt", "_gdt", "_hgdt2")
+
     def __init__(self, angle, velocity, height):
         """Create a projectile with given launch angle, initial
         velocity and height."""
@@ -23,14 +27,21 @@ class Projectile:
         theta = radians(angle)
         self.xvel = velocity * cos(theta)
         self.yvel = velocity * sin(theta)
+        self.vel = hypot(self.xvel, self.yvel)
+        # time step of the last update, with its gravity terms 9.8*dt and 4.9*dt*dt
+        self._dt = None
 
     def update(self, time):
         """Update the state of this projectile to move it time seconds
         farther into its flight"""
+        if time != self._dt:
+            self._dt = time
+            self._gdt = 9.8 * time
+            self._hgdt2 = 4.9 * time * time
         self.xpos = self.xpos + time * self.xvel
-        yvel1 = self.yvel - 9.8 * time
-        self.ypos = self.ypos + time * (self.yvel + yvel1) / 2.0
-        self.yvel = yvel1
+        self.ypos = self.ypos + time * self.yvel - self._hgdt2
+        self.yvel = self.yvel - self._gdt
+        self.vel = hypot(self.xvel, self.yvel)
 
     def getY(self):
         "Returns the y position (height) of this projectile."
@@ -41,6 +52,5 @@ class Projectile:
         return self.xpos
 
     def getVel(self):
-        "Returns velocity (speed, m/s) of this projectile."
-        self.vel = sqrt((self.xvel)**2 + (self.yvel)**2)
+        "Returns velocity (speed, m/s) of this projectile, as of the last update."
         return self.vel
\ No newline at end of file
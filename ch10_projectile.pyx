@@ -0,0 +1,57 @@
+# cython: language_level=3
+# projectile.pyx
+
+"""
+Compiled (Cython) version of ch10_projectile.py, providing the same Projectile class. Build it with
+
+    python setup.py build_ext --inplace
+
+The resulting extension module is imported in place of ch10_projectile.py; if it has not been
+built, the pure-Python module is used instead. The animation (main_animation.py, render_pygame.py)
+does not use Projectile; this module is for code that imports it directly.
+"""
+
+cimport cython
+from libc.math cimport hypot, sin, cos, M_PI
+
+
+cdef class Projectile:
+
+    """Simulates the flight of simple projectiles near the earth's
+    surface, ignoring wind resistance. Tracking is done in two
+    dimensions, height (y) and distance (x)."""
+
+    cdef public double xpos, ypos, xvel, yvel, vel
+
+    def __init__(self, double angle, double velocity, double height):
+        """Create a projectile with given launch angle, initial
+        velocity and height."""
+        cdef double theta = angle * M_PI / 180.0
+        self.xpos = 0.0
+        self.ypos = height
+        self.xvel = velocity * cos(theta)
+        self.yvel = velocity * sin(theta)
+        self.vel = hypot(self.xvel, self.yvel)
+
+    @cython.cdivision(True)
+    @cython.boundscheck(False)
+    cpdef void update(self, double time):
+        """Update the state of this projectile to move it time seconds
+        farther into its flight"""
+        cdef double yvel1 = self.yvel - 9.8 * time
+        self.xpos = self.xpos + time * self.xvel
+        self.ypos = self.ypos + time * (self.yvel + yvel1) / 2.0
+        self.yvel = yvel1
+        self.vel = hypot(self.xvel, self.yvel)
+
+    cpdef double getY(self):
+        "Returns the y position (height) of this projectile."
+        return self.ypos
+
+    cpdef double getX(self):
+        "Returns the x position (distance) of this projectile."
+        return self.xpos
+
+    cpdef double getVel(self):
+        "Returns velocity (speed, m/s) of this projectile, as of the last update."
+        return self.vel
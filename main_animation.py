@@ -17,15 +17,57 @@ only show final distance/velocity of the 3rd ball). Display will show N/A (>420m
 simulation window.
 """
 
-from math import sqrt, sin, cos, radians, degrees, pi
+import time
 from graphics import *
-from ch10_projectile import Projectile
+from volley import DT, LauncherState, TrackedVolley
 
-class Launcher:
+# minimum time (s) between refreshes of the initial angle/velocity displays, so a burst of key presses
+# (e.g. held-down auto-repeat) only re-texts them every 50 ms
+_INIT_REFRESH = 0.05
+
+class BufferedWin(GraphWin):
+
+    """ GraphWin that does not redraw after every change. Moving shots queue their canvas moves, coordinates
+    and text here, and the whole frame is sent to Tk at once by flushPending(). """
+
+    def __init__(self, title, width, height):
+        GraphWin.__init__(self, title, width, height, autoflush=False)
+        self._pendingMoves = {}
+        self._pendingCoords = {}
+        self._pendingText = {}
+
+    def queueMove(self, tag, dx, dy):
+        """ move all canvas items with tag by dx, dy pixels on the next flush """
+        pdx, pdy = self._pendingMoves.get(tag, (0, 0))
+        self._pendingMoves[tag] = (pdx + dx, pdy + dy)
+
+    def queueCoords(self, item, *coords):
+        """ set the screen coordinates of canvas item on the next flush """
+        self._pendingCoords[item] = coords
+
+    def queueText(self, item, text):
+        """ set the text of canvas item on the next flush """
+        self._pendingText[item] = text
+
+    def flushPending(self):
+        """ apply all queued moves, coordinate and text changes to the canvas """
+        for tag, (dx, dy) in self._pendingMoves.items():
+            if dx or dy:
+                self.move(tag, dx, dy)
+        for item, coords in self._pendingCoords.items():
+            self.coords(item, *coords)
+        for item, text in self._pendingText.items():
+            self.itemconfig(item, text=text)
+        self._pendingMoves.clear()
+        self._pendingCoords.clear()
+        self._pendingText.clear()
+
+
+class Launcher(LauncherState):
 
     def __init__(self, win):
         """Create initial launcher with angle 45 degrees and velocity 40
-        win is the GraphWin to draw the launcher in.
+        win is the BufferedWin to draw the launcher in.
         """
         
         # draw the base shot of the launcher
@@ -36,123 +78,104 @@ class Launcher:
 
         # save the window and create initial angle and velocity
         self.win = win
-        self.angle = radians(45.0)
-        self.vel = 40.0
+        LauncherState.__init__(self)
         
-        # create initial "dummy" arrow
+        # draw the arrow once; redraw() only moves its end point
         self.arrow = Line(Point(0,0), Point(0,0)).draw(win)
-        # replace it with the correct arrow
+        self.arrow.setArrow("last")
+        self.arrow.setWidth(3)
         self.redraw()
 
 
     def redraw(self):
-        """undraw the arrow and draw a new one for the
-        current values of angle and velocity.
+        """move the arrow's end point to match the current values
+        of angle and velocity. The change is queued on the window.
         """
         
-        self.arrow.undraw()
-        pt2 = Point(self.vel*cos(self.angle), self.vel*sin(self.angle))
-        self.arrow = Line(Point(0,0), pt2).draw(self.win)
-        self.arrow.setArrow("last")
-        self.arrow.setWidth(3)
+        win = self.win
+        x0, y0 = win.toScreen(0, 0)
+        x1, y1 = win.toScreen(self.vel*self._cos, self.vel*self._sin)
+        win.queueCoords(self.arrow.id, x0, y0, x1, y1)
 
         
     def adjAngle(self, amt):
         """ change angle by amt degrees """
         
-        self.angle = self.angle+radians(amt)
+        LauncherState.adjAngle(self, amt)
         self.redraw()
 
         
     def adjVel(self, amt):
         """ change velocity by amt"""
         
-        self.vel = self.vel + amt
+        LauncherState.adjVel(self, amt)
         self.redraw()
 
-    def fire(self):
-        """ uses ShotTracker to display and fire the cannonball"""
-        return ShotTracker(self.win, degrees(self.angle), self.vel, 0.0)
+    def fire(self, height):
+        """ uses ShotTracker to display a cannonball fired from the given height"""
+        return ShotTracker(self.win, height)
   
 
 class ShotTracker:
 
-    """ Graphical depiction of a projectile flight using a Circle """
+    """ Graphical depiction of a projectile flight using a Circle. The flight itself is simulated by the
+    app's TrackedVolley, which advances every live shot at once and hands each tracker its new position.
+    A landed tracker is hidden rather than undrawn so it can be relaunched for a later shot. """
+
+    __slots__ = ("win", "marker", "stat", "tag", "sx", "sy")
 
-    def __init__(self, win, angle, velocity, height):
-        """win is the GraphWin to display the shot, angle, velocity, and
-        height are initial projectile parameters.
+    def __init__(self, win, height):
+        """win is the BufferedWin to display the shot, height is the launch height.
         """
         
-        self.proj = Projectile(angle, velocity, height)
+        self.win = win
         self.marker = Circle(Point(0,height), 3)
         self.marker.setFill("red")
         self.marker.setOutline("red")
         self.marker.draw(win)
-        self.statX = Text(Point(self.proj.getX(), self.proj.getY()+20), "x (m):")
-        self.statXval = Text(Point(self.proj.getX()+15, self.proj.getY()+20), "")
-        self.statX.draw(win)
-        self.statXval.draw(win)
-        self.statY = Text(Point(self.proj.getX(), self.proj.getY()+15), "y (m):")
-        self.statYval = Text(Point(self.proj.getX()+15, self.proj.getY()+15), "")
-        self.statY.draw(win)
-        self.statYval.draw(win)
-        self.statV = Text(Point(self.proj.getX(), self.proj.getY()+10), "Speed (m/s):")
-        self.statVval = Text(Point(self.proj.getX()+23, self.proj.getY()+10), "")
-        self.statV.draw(win)
-        self.statVval.draw(win)
+        # x, y-distance and speed are shown together in a single multi-line label above the marker
+        self.stat = Text(Point(10, height+15), "")
+        self.stat.draw(win)
+        # marker and label share a canvas tag so both are moved by a single Tk call
+        self.tag = f"shot{id(self)}"
+        win.addtag_withtag(self.tag, self.marker.id)
+        win.addtag_withtag(self.tag, self.stat.id)
+        # current screen position of the marker's center
+        self.sx, self.sy = win.toScreen(0, height)
 
         
-    def update(self, dt):
-        """ Move the shot dt seconds farther along its flight """
-
-        self.proj.update(dt)
-        center = self.marker.getCenter()
-        dx = self.proj.getX() - center.getX()
-        dy = self.proj.getY() - center.getY()
-        self.marker.move(dx,dy)
-        self.statX.move(dx,dy)
-        self.statXval.setText(round(self.proj.getX(),1))
-        self.statXval.move(dx, dy)
-        self.statY.move(dx, dy)
-        self.statYval.move(dx, dy)
-        self.statV.move(dx, dy)
-        self.statVval.move(dx, dy)
-        self.statVval.setText(round(self.proj.getVel(),1))
-        if self.proj.getY() >= 0 and self.proj.getX() <= 420:
-            self.statYval.setText(round(self.proj.getY(),1))
-            self.statVval.setText(round(self.proj.getVel(), 1))
-        else:
-            self.statX.undraw()
-            self.statXval.undraw()
-            self.statY.undraw()
-            self.statYval.undraw()
-            self.statV.undraw()
-            self.statVval.undraw()
+    def update(self, x, y, vel):
+        """ Move the shot to (x, y) and display its position and speed vel. The changes are queued on the
+        window and appear at its next flushPending(). """
 
-        
-    def getX(self):
-        """ return the current x coordinate of the shot's center """
-        return self.proj.getX()
+        # marker and label are moved directly on the canvas, so their own Point state is left as drawn.
+        # the volley retires the shot on the frame it lands or leaves the window, so it is always on screen here.
+        self._moveTo(x, y)
+        self.win.queueText(self.stat.id, f"x (m): {x:.1f}\ny (m): {y:.1f}\nSpeed (m/s): {vel:.1f}")
 
-    def getY(self):
-        """ return the current y coordinate of the shot's center """
-        return self.proj.getY()
+    def relaunch(self, height):
+        """ reuse a retired shot for a new launch from the given height """
+        self._moveTo(0, height)
+        self.win.queueText(self.stat.id, "")
+        self.win.itemconfig(self.tag, state="normal")
 
-    def getVel(self):
-        """return the current speed of the shot"""
-        return self.proj.getVel()
+    def retire(self):
+        """ hide the shot once it has landed, keeping its canvas items for relaunch() """
+        self.win.itemconfig(self.tag, state="hidden")
 
-    def undraw(self):
-        """ undraw the shot """
-        self.marker.undraw()
+    def _moveTo(self, x, y):
+        """ queue moving the marker (and label) so the marker is centered on world point (x, y) """
+        sx, sy = self.win.toScreen(x, y)
+        self.win.queueMove(self.tag, sx - self.sx, sy - self.sy)
+        self.sx = sx
+        self.sy = sy
 
 
 class ProjectileApp:
 
     def __init__(self):
         """ Prepares and draws the program window """
-        self.win = GraphWin("Projectile Animation", 1280, 960)
+        self.win = BufferedWin("Projectile Animation", 1280, 960)
         self.win.setCoords(-20, -20, 420, 310)
         Line(Point(-20,0), Point(420,0)).draw(self.win)
         for x in range(0, 420, 100):
@@ -161,42 +184,47 @@ class ProjectileApp:
 
         self.launcher = Launcher(self.win)
         initAngleTxt = Text(Point(10, 300), "Initial Angle (degrees):")
-        self.initAngle = Text(Point(45,300), self.launcher.angle * (180/pi))
+        self.initAngle = Text(Point(45,300), self.launcher.angle)
         initAngleTxt.draw(self.win)
         self.initAngle.draw(self.win)
         initVelTxt = Text(Point(7,285), "Initial Velocity (m/s):")
         self.initVel = Text(Point(45,285), self.launcher.vel)
         initVelTxt.draw(self.win)
         self.initVel.draw(self.win)
+        # set by the key handlers when initAngle/initVel need to be redrawn, which happens at most
+        # every _INIT_REFRESH seconds
+        self._angleDirty = False
+        self._velDirty = False
+        self._lastInitRefresh = 0.0
         finPosTxt = Text(Point(15,-15), "Last Shot Distance (m):")
         finPosTxt.draw(self.win)
         finVelTxt = Text(Point(120,-15), "Last Shot Final Speed (m/s):")
         finVelTxt.draw(self.win)
-        self.shots = []
-
-    def updateShots(self, dt):
-        """ Updates each cannonball after firing, as well as their respective x, y-distance and velocity display. """
-        alive = []
-        x = ""
-        y = ""
-        v = ""
-        for shot in self.shots:
-            shot.update(dt)
-            x = round(shot.getX(), 1)
-            v = round(shot.getVel(), 1)
-            if shot.getY() > 0.0 and shot.getX() < 420:
-                alive.append(shot)
-                y = round(shot.getY(), 1)
-            elif shot.getY() > 0.0 and shot.getX() > 420:
-                x = "N/A (>420)"
-                y = 0.0
-                v = "N/A"
-                shot.undraw()
-            else:
-                y = 0.0
-                shot.undraw()
-        self.shots = alive
-        return x, y, v
+        # retired ShotTrackers, reused by fire() instead of creating new canvas items
+        self._pool = []
+        self.volley = TrackedVolley(DT, self._retireShot)
+
+    def fire(self):
+        """ Fires a cannonball from the launcher and adds it to the volley. """
+        xvel, yvel = self.launcher.getVelComponents()
+        height = 0.0
+        if self._pool:
+            shot = self._pool.pop()
+            shot.relaunch(height)
+        else:
+            shot = self.launcher.fire(height)
+        self.volley.fire(xvel, yvel, height, shot)
+
+    def _retireShot(self, shot):
+        """ hides a tracker whose shot has retired and keeps it for reuse by fire() """
+        shot.retire()
+        self._pool.append(shot)
+
+    def updateShots(self):
+        """ Updates each cannonball after firing, as well as their respective x, y-distance and velocity display.
+        Returns the final distance and speed display strings of the last shot fired if it retired this frame,
+        otherwise None. """
+        return self.volley.update()
 
 
     def run(self):
@@ -209,32 +237,56 @@ class ProjectileApp:
         finVel.draw(self.win)
         # main event/animation loop.
         while True:
+            # initial angle/velocity displays are refreshed at most every _INIT_REFRESH seconds, however
+            # many key presses changed them since the last refresh; the final value of a burst is shown once
+            # the interval has passed.
+            if self._angleDirty or self._velDirty:
+                now = time.perf_counter()
+                if now - self._lastInitRefresh >= _INIT_REFRESH:
+                    if self._angleDirty:
+                        self.initAngle.setText(f"{self.launcher.angle:.1f}")
+                        self._angleDirty = False
+                    if self._velDirty:
+                        self.initVel.setText(f"{self.launcher.vel:.1f}")
+                        self._velDirty = False
+                    self._lastInitRefresh = now
+
             # updates each shot at 120 fps (120 times a sec.)
-            x, y, v = self.updateShots(1/120)
+            landed = self.updateShots()
             # sets last shot final horizontal distance and speed upon landing on the ground (y=0.0m).
-            if x != "" and y <= 0.0:
-                finPos.setText(x)
-                finVel.setText(v)
+            if landed is not None:
+                finPos.setText(landed[0])
+                finVel.setText(landed[1])
 
             key = self.win.checkKey()
             if key in ["q", "Q"]:
                 break
 
+            # nothing in flight and no key pressed: there is nothing to animate, so only let Tk handle
+            # pending events and wait for input at a much lower rate instead of spinning at 240 fps.
+            if not self.volley.shots and key == "":
+                self.win.flushPending()
+                update()
+                time.sleep(0.05)
+                continue
+
             if key == "Up":
                 self.launcher.adjAngle(2.5)
-                self.initAngle.setText(round(self.launcher.angle * (180/pi), 1))
+                self._angleDirty = True
             elif key == "Down":
                 self.launcher.adjAngle(-2.5)
-                self.initAngle.setText(round(self.launcher.angle * (180 / pi), 1))
+                self._angleDirty = True
             elif key == "Right":
                 self.launcher.adjVel(1)
-                self.initVel.setText(round(self.launcher.vel, 1))
+                self._velDirty = True
             elif key == "Left":
                 self.launcher.adjVel(-1)
-                self.initVel.setText(round(self.launcher.vel, 1))
+                self._velDirty = True
             elif key == "f":
-                self.shots.append(self.launcher.fire())
+                self.fire()
            
+            # send this frame's queued shot changes to Tk in one batch, then redraw once
+            self.win.flushPending()
             update(240)
 
         self.win.close()
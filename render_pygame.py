@@ -0,0 +1,208 @@
+# render_pygame.py
+
+"""Multiple-shot cannonball animation drawn with pygame instead of graphics.py (Tk).
+
+Shows the same scene and displays as main_animation.py, with the same controls: use the arrow keys to adjust
+angle/initial velocity, press F to fire and Q to quit. Shots are simulated by the same Volley; only the view
+is different. Each frame is drawn into pygame's back buffer and shown with a single display flip, and text
+is rendered once per change and then blitted from a cached surface.
+"""
+
+import pygame
+from volley import DT, LauncherState, TrackedVolley
+
+WIDTH = 1280
+HEIGHT = 960
+
+# world coordinates (m) of the window, as set with setCoords() in main_animation.py
+_XLOW, _YLOW, _XHIGH, _YHIGH = -20, -20, 420, 310
+_XSCALE = (WIDTH - 1) / (_XHIGH - _XLOW)
+_YSCALE = (HEIGHT - 1) / (_YHIGH - _YLOW)
+# cannonball (and launcher base) radius in pixels, 3m in world coordinates
+_RADIUS = round(3 * _XSCALE)
+
+
+def toScreen(x, y):
+    """ returns the pixel coordinates of world point (x, y) """
+    return int((x - _XLOW) * _XSCALE + 0.5), int((_YHIGH - y) * _YSCALE + 0.5)
+
+
+class Label:
+
+    """ A line of text drawn centered on a world point. The text is only rendered when it changes. """
+
+    __slots__ = ("font", "color", "text", "surface")
+
+    def __init__(self, font, text, color="black"):
+        self.font = font
+        self.color = color
+        self.text = None
+        self.setText(text)
+
+    def setText(self, text):
+        """ change the text, rendering it if it differs from the current one """
+        if text != self.text:
+            self.text = text
+            self.surface = self.font.render(text, True, self.color)
+
+    def draw(self, screen, x, y):
+        """ blit the text centered on world point (x, y) """
+        screen.blit(self.surface, self.surface.get_rect(center=toScreen(x, y)))
+
+
+class Launcher(LauncherState):
+
+    def draw(self, screen):
+        """ draw the launcher base and an arrow for the current angle and velocity """
+        x0, y0 = toScreen(0, 0)
+        x1, y1 = toScreen(self.vel*self._cos, self.vel*self._sin)
+        pygame.draw.circle(screen, "red", (x0, y0), _RADIUS)
+        pygame.draw.line(screen, "black", (x0, y0), (x1, y1), 3)
+        # arrowhead: 10px long and 10px wide, pointing along the arrow (no head for a zero-length arrow)
+        dx, dy = x1 - x0, y1 - y0
+        length = (dx*dx + dy*dy) ** 0.5
+        if length:
+            ux, uy = dx / length, dy / length
+            pygame.draw.polygon(screen, "black", [(x1, y1),
+                                                  (x1 - 10*ux - 5*uy, y1 - 10*uy + 5*ux),
+                                                  (x1 - 10*ux + 5*uy, y1 - 10*uy - 5*ux)])
+
+
+class ShotSprite:
+
+    """ Graphical depiction of a projectile flight: a red ball with its x, y-distance and speed above it """
+
+    __slots__ = ("x", "y", "lines")
+
+    def __init__(self, font, height):
+        self.x = 0.0
+        self.y = height
+        self.lines = (Label(font, ""), Label(font, ""), Label(font, ""))
+
+    def update(self, x, y, vel):
+        """ Move the shot to (x, y) and display its position and speed vel. The volley retires a shot on the
+        frame it lands or leaves the window, so it is always on screen here. """
+        self.x = x
+        self.y = y
+        xLine, yLine, vLine = self.lines
+        xLine.setText(f"x (m): {x:.1f}")
+        yLine.setText(f"y (m): {y:.1f}")
+        vLine.setText(f"Speed (m/s): {vel:.1f}")
+
+    def draw(self, screen):
+        pygame.draw.circle(screen, "red", toScreen(self.x, self.y), _RADIUS)
+        for i, line in enumerate(self.lines):
+            line.draw(screen, self.x + 10, self.y + 20 - 5*i)
+
+
+class ProjectileApp:
+
+    def __init__(self):
+        """ Prepares the program window """
+        pygame.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Projectile Animation")
+        # repeat held-down keys, like Tk's key auto-repeat
+        pygame.key.set_repeat(300, 30)
+        self.font = pygame.font.SysFont("helvetica", 16)
+        self.clock = pygame.time.Clock()
+
+        self.launcher = Launcher()
+        self.initAngle = Label(self.font, f"{self.launcher.angle:.1f}")
+        self.initVel = Label(self.font, f"{self.launcher.vel:.1f}")
+        self.finPos = Label(self.font, "", "green")
+        self.finVel = Label(self.font, "", "blue")
+        # fixed text, with the world point each is centered on
+        self.captions = [(Label(self.font, str(x)), x, -7) for x in range(0, 420, 100)]
+        self.captions += [(Label(self.font, "Initial Angle (degrees):"), 10, 300),
+                          (Label(self.font, "Initial Velocity (m/s):"), 7, 285),
+                          (Label(self.font, "Last Shot Distance (m):"), 15, -15),
+                          (Label(self.font, "Last Shot Final Speed (m/s):"), 120, -15)]
+
+        # retired sprites are simply dropped
+        self.volley = TrackedVolley(DT)
+
+    def fire(self):
+        """ Fires a cannonball from the launcher and adds it to the volley. """
+        xvel, yvel = self.launcher.getVelComponents()
+        height = 0.0
+        self.volley.fire(xvel, yvel, height, ShotSprite(self.font, height))
+
+    def updateShots(self):
+        """ Updates each cannonball after firing, as well as their respective x, y-distance and velocity display.
+        Returns the final distance and speed display strings of the last shot fired if it retired this frame,
+        otherwise None. """
+        return self.volley.update()
+
+    def onKey(self, key):
+        """ handle a key press; returns False when the program should quit """
+        if key == pygame.K_q:
+            return False
+        if key == pygame.K_UP:
+            self.launcher.adjAngle(2.5)
+            self.initAngle.setText(f"{self.launcher.angle:.1f}")
+        elif key == pygame.K_DOWN:
+            self.launcher.adjAngle(-2.5)
+            self.initAngle.setText(f"{self.launcher.angle:.1f}")
+        elif key == pygame.K_RIGHT:
+            self.launcher.adjVel(1)
+            self.initVel.setText(f"{self.launcher.vel:.1f}")
+        elif key == pygame.K_LEFT:
+            self.launcher.adjVel(-1)
+            self.initVel.setText(f"{self.launcher.vel:.1f}")
+        elif key == pygame.K_f:
+            self.fire()
+        return True
+
+    def draw(self):
+        """ draw the whole scene into the back buffer and show it """
+        screen = self.screen
+        screen.fill("white")
+        pygame.draw.line(screen, "black", toScreen(-20, 0), toScreen(420, 0))
+        for x in range(0, 420, 100):
+            pygame.draw.line(screen, "black", toScreen(x, 0), toScreen(x, 2))
+        for label, x, y in self.captions:
+            label.draw(screen, x, y)
+        self.initAngle.draw(screen, 45, 300)
+        self.initVel.draw(screen, 45, 285)
+        self.finPos.draw(screen, 60, -15)
+        self.finVel.draw(screen, 165, -15)
+        self.launcher.draw(screen)
+        for shot in self.volley.shots:
+            shot.draw(screen)
+        pygame.display.flip()
+
+    def run(self):
+        self.draw()
+        # main event/animation loop.
+        while True:
+            # updates each shot at 120 fps (120 times a sec.)
+            landed = self.updateShots()
+            # sets last shot final horizontal distance and speed upon landing on the ground (y=0.0m).
+            if landed is not None:
+                self.finPos.setText(landed[0])
+                self.finVel.setText(landed[1])
+
+            pressed = False
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    return
+                if event.type == pygame.KEYDOWN:
+                    pressed = True
+                    if not self.onKey(event.key):
+                        pygame.quit()
+                        return
+
+            # nothing in flight, nothing landed and no key pressed: the last frame shown is still current,
+            # so wait for input at a much lower rate instead of redrawing at 240 fps.
+            if not self.volley.shots and landed is None and not pressed:
+                pygame.time.wait(50)
+                continue
+
+            self.draw()
+            self.clock.tick(240)
+
+
+if __name__ == "__main__":
+    ProjectileApp().run()
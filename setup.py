@@ -0,0 +1,13 @@
+# setup.py
+
+"""Builds the optional compiled Projectile class (ch10_projectile.pyx) in place:
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    ext_modules=cythonize(["ch10_projectile.pyx"]),
+)
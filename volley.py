@@ -0,0 +1,183 @@
+# volley.py
+
+"""
+Simulates the launcher and the flight of every live cannonball at once, independently of how they are drawn.
+Used by both the graphics.py (main_animation.py) and the pygame (render_pygame.py) versions of the animation,
+which only add the drawing.
+
+Shots are positioned from the closed-form solution (neglecting air resistance), with the launch state of
+every shot kept in parallel NumPy arrays so that all of them are advanced in a single vectorized step.
+TrackedVolley keeps the renderer's tracker of each shot in step with the volley.
+"""
+
+from math import sqrt, sin, cos, ceil, pi, inf
+import numpy as np
+
+# simulation time step (s): shots are updated 120 times a second
+DT = 1/120
+_DEG2RAD = pi / 180.0
+
+
+def _trajectory(xvel, yvel, height, t):
+    """ Returns the x, y position and speed arrays of shots launched with velocity components xvel, yvel
+    from the given height, t seconds into their flight (closed-form solution, no air resistance). """
+    return xvel * t, height + yvel * t - 4.9 * t * t, np.hypot(xvel, yvel - 9.8 * t)
+
+
+# numexpr is optional: it evaluates each expression in a single fused pass without the intermediate arrays
+# NumPy allocates, but its fixed cost per call (tens of microseconds) is far higher than NumPy's, so it only
+# pays off for very large volleys. Below this many shots the NumPy version is used even when it is installed.
+_NUMEXPR_MIN_SHOTS = 10000
+
+try:
+    import numexpr as ne
+except ImportError:
+    pass
+else:
+    _numpy_trajectory = _trajectory
+
+    def _trajectory(xvel, yvel, height, t):
+        """ numexpr version of _trajectory above, for volleys of at least _NUMEXPR_MIN_SHOTS shots """
+        if len(t) < _NUMEXPR_MIN_SHOTS:
+            return _numpy_trajectory(xvel, yvel, height, t)
+        return (ne.evaluate("xvel * t"),
+                ne.evaluate("height + yvel * t - 4.9 * t * t"),
+                ne.evaluate("sqrt(xvel * xvel + (yvel - 9.8 * t) * (yvel - 9.8 * t))"))
+
+
+class LauncherState:
+
+    """ Launch angle (degrees) and velocity (m/s) of the launcher. """
+
+    def __init__(self):
+        """Create initial launcher state with angle 45 degrees and velocity 40"""
+        self.angle = 45.0
+        self.vel = 40.0
+        # cos/sin of the launch angle, recomputed only when the angle changes
+        self._cos = cos(self.angle * _DEG2RAD)
+        self._sin = sin(self.angle * _DEG2RAD)
+
+    def adjAngle(self, amt):
+        """ change angle by amt degrees """
+        self.angle = self.angle+amt
+        self._cos = cos(self.angle * _DEG2RAD)
+        self._sin = sin(self.angle * _DEG2RAD)
+
+    def adjVel(self, amt):
+        """ change velocity by amt"""
+        self.vel = self.vel + amt
+
+    def getVelComponents(self):
+        """ returns the x and y components of the launch velocity """
+        return self.vel*self._cos, self.vel*self._sin
+
+
+# returned by Volley.update() while there are no live shots
+_NO_SHOTS = np.zeros(0)
+_NONE_ALIVE = np.zeros(0, dtype=bool)
+
+
+class Volley:
+
+    """ The live shots of the animation, advanced dt seconds per frame. A shot retires once it lands on
+    the ground (y = 0.0m) or passes the right edge of the simulation window (x = 420m). """
+
+    def __init__(self, dt):
+        """ dt is the simulation time step (s) of one frame """
+        self.dt = dt
+        self.frame = 0
+        # one entry per live shot, in launch order
+        self.xvel = np.zeros(0)
+        self.yvel = np.zeros(0)
+        self.height = np.zeros(0)
+        self.launchFrame = np.zeros(0)
+        # first frame on which each shot is on/below the ground, and past the right edge (x = 420m)
+        self.landFrame = np.zeros(0)
+        self.outFrame = np.zeros(0)
+
+    def fire(self, xvel, yvel, height):
+        """ Adds a shot launched with velocity components xvel, yvel (m/s) from the given height (m). """
+        self.xvel = np.append(self.xvel, xvel)
+        self.yvel = np.append(self.yvel, yvel)
+        self.height = np.append(self.height, height)
+        self.launchFrame = np.append(self.launchFrame, self.frame)
+        # flight time until the shot returns to the ground (y = 0.0m), and until it passes x = 420m
+        tland = (yvel + sqrt(yvel*yvel + 2*9.8*height)) / 9.8
+        self.landFrame = np.append(self.landFrame, self.frame + ceil(tland / self.dt))
+        self.outFrame = np.append(self.outFrame, self.frame + ceil(420 / (xvel * self.dt)) if xvel > 0 else inf)
+
+    def update(self):
+        """ Advances every shot one frame. Returns the x, y position and speed arrays of the shots (in launch
+        order), a mask of the ones still alive, and the final distance and speed display strings of the last
+        shot fired if it retired this frame (None otherwise). Retired shots are dropped from the volley. """
+        self.frame += 1
+        if not self.xvel.size:
+            return _NO_SHOTS, _NO_SHOTS, _NO_SHOTS, _NONE_ALIVE, None
+
+        # position every live shot from the closed-form solution at its flight time t
+        t = (self.frame - self.launchFrame) * self.dt
+        xpos, ypos, vel = _trajectory(self.xvel, self.yvel, self.height, t)
+        # landing and leaving the window were worked out at launch, so retiring is a frame count check
+        inflight = self.frame < self.landFrame
+        alive = inflight & (self.frame < self.outFrame)
+
+        # only the last shot fired is reported back, and only once it has landed or left the window
+        landed = None
+        if not alive[-1]:
+            if inflight[-1]:
+                landed = ("N/A (>420)", "N/A")
+            else:
+                landed = (f"{xpos[-1]:.1f}", f"{vel[-1]:.1f}")
+
+        if not alive.all():
+            self.xvel = self.xvel[alive]
+            self.yvel = self.yvel[alive]
+            self.height = self.height[alive]
+            self.launchFrame = self.launchFrame[alive]
+            self.landFrame = self.landFrame[alive]
+            self.outFrame = self.outFrame[alive]
+        return xpos, ypos, vel, alive, landed
+
+
+class TrackedVolley:
+
+    """ A Volley together with the trackers that draw its shots, one per live shot and in the same order.
+    Every frame each tracker is handed its shot's new position and speed with tracker.update(x, y, vel);
+    the tracker of a retired shot is dropped and passed to onRetire (if given), e.g. to hide it for reuse. """
+
+    def __init__(self, dt, onRetire=None):
+        """ dt is the simulation time step (s) of one frame """
+        self.volley = Volley(dt)
+        # trackers of the live shots, in the same order as the shots of the volley
+        self.shots = []
+        self.onRetire = onRetire
+
+    def fire(self, xvel, yvel, height, shot):
+        """ Adds a shot launched with velocity components xvel, yvel (m/s) from the given height (m), drawn
+        by the tracker shot. """
+        self.volley.fire(xvel, yvel, height)
+        self.shots.append(shot)
+
+    def update(self):
+        """ Advances every shot one frame and updates its tracker. Returns the final distance and speed
+        display strings of the last shot fired if it retired this frame, otherwise None. """
+        xpos, ypos, vel, alive, landed = self.volley.update()
+        shots = self.shots
+        if not shots:
+            return None
+
+        for shot, sx, sy, sv in zip(shots, xpos.tolist(), ypos.tolist(), vel.tolist()):
+            shot.update(sx, sy, sv)
+
+        if not alive.all():
+            # compact shots in place: survivors are shifted down over retired shots, keeping their order
+            onRetire = self.onRetire
+            write = 0
+            for shot, keep in zip(shots, alive.tolist()):
+                if keep:
+                    shots[write] = shot
+                    write += 1
+                elif onRetire is not None:
+                    onRetire(shot)
+            del shots[write:]
+        return landed